@@ -1,19 +1,49 @@
-import base64
+import asyncio
+import binascii
 import mimetypes
+from collections.abc import Callable
 from typing import Any
 
 import aiohttp
-from discord import Attachment
+from discord import Attachment, HTTPException
 
-from .client import get_http_session
 
-SUPPORTED_IMAGE_TYPES = {"image/jpeg", "image/png", "image/gif", "image/webp"}
-SUPPORTED_DOCUMENT_TYPES = {
-    "application/pdf",
-    "text/plain",
-    "text/markdown",
-    "text/csv",
-}
+def _b2a_base64_as_string(data: bytes) -> str:
+    """Stdlib base64 encoder used when pybase64 is unavailable.
+
+    Calling ``binascii`` directly skips the trailing-newline strip and extra
+    copy that ``base64.b64encode`` performs.
+    """
+    return binascii.b2a_base64(data, newline=False).decode("ascii")
+
+
+try:
+    from pybase64 import b64encode_as_string as _b64encode_as_string
+except ImportError:  # pragma: no cover - pybase64 ships wheels for supported platforms
+    _b64encode_as_string = _b2a_base64_as_string
+
+# Attachments above this size are encoded on a worker thread so a multi-MB
+# base64 pass doesn't stall the Discord event loop.
+ATTACHMENT_OFFLOAD_THRESHOLD_BYTES = 256 * 1024
+
+SUPPORTED_IMAGE_TYPES = frozenset({"image/jpeg", "image/png", "image/gif", "image/webp"})
+SUPPORTED_DOCUMENT_TYPES = frozenset(
+    {
+        "application/pdf",
+        "text/plain",
+        "text/markdown",
+        "text/csv",
+    }
+)
+
+
+def _encode_base64(data: bytes) -> str:
+    """Base64-encode attachment bytes straight into a ``str``.
+
+    Skips the intermediate ``bytes`` object that ``b64encode(...).decode()``
+    materializes, which halves transient allocation for large PDFs.
+    """
+    return _b64encode_as_string(data)
 
 
 def _sniff_attachment_media_type(data: bytes) -> str | None:
@@ -61,6 +91,66 @@ def infer_attachment_content_type(
     return ""
 
 
+def _build_image_block(content_type: str, data: bytes, filename: str | None) -> dict[str, Any]:
+    return {
+        "type": "image",
+        "source": {
+            "type": "base64",
+            "media_type": content_type,
+            "data": _encode_base64(data),
+        },
+    }
+
+
+def _build_pdf_block(content_type: str, data: bytes, filename: str | None) -> dict[str, Any]:
+    block: dict[str, Any] = {
+        "type": "document",
+        "source": {
+            "type": "base64",
+            "media_type": "application/pdf",
+            "data": _encode_base64(data),
+        },
+        "citations": {"enabled": True},
+    }
+    if filename:
+        block["title"] = filename
+    return block
+
+
+def _build_text_block(content_type: str, data: bytes, filename: str | None) -> dict[str, Any]:
+    # Most code/text uploads are plain ASCII; skip UTF-8 validation for them.
+    if data.isascii():
+        text_content = data.decode("ascii")
+    else:
+        try:
+            text_content = data.decode("utf-8")
+        except UnicodeDecodeError:
+            text_content = data.decode("latin-1")
+
+    block: dict[str, Any] = {
+        "type": "document",
+        "source": {
+            "type": "text",
+            "media_type": "text/plain",
+            "data": text_content,
+        },
+        "citations": {"enabled": True},
+    }
+    if filename:
+        block["title"] = filename
+    return block
+
+
+_ContentBlockBuilder = Callable[[str, bytes, str | None], dict[str, Any]]
+
+# Exact media type -> block builder; any other ``text/*`` type falls back to text.
+_CONTENT_BLOCK_BUILDERS: dict[str, _ContentBlockBuilder] = {
+    **dict.fromkeys(SUPPORTED_DOCUMENT_TYPES - {"application/pdf"}, _build_text_block),
+    **dict.fromkeys(SUPPORTED_IMAGE_TYPES, _build_image_block),
+    "application/pdf": _build_pdf_block,
+}
+
+
 def build_attachment_content_block(
     content_type: str,
     data: bytes,
@@ -68,72 +158,44 @@ def build_attachment_content_block(
 ) -> dict[str, Any] | None:
     """Build the appropriate Anthropic content block for an attachment."""
     content_type = infer_attachment_content_type(content_type, data, filename)
-    if content_type in SUPPORTED_IMAGE_TYPES:
-        return {
-            "type": "image",
-            "source": {
-                "type": "base64",
-                "media_type": content_type,
-                "data": base64.b64encode(data).decode("utf-8"),
-            },
-        }
-    if content_type == "application/pdf":
-        block: dict[str, Any] = {
-            "type": "document",
-            "source": {
-                "type": "base64",
-                "media_type": "application/pdf",
-                "data": base64.b64encode(data).decode("utf-8"),
-            },
-            "citations": {"enabled": True},
-        }
-        if filename:
-            block["title"] = filename
-        return block
-    if content_type in SUPPORTED_DOCUMENT_TYPES or (
-        content_type and content_type.startswith("text/")
-    ):
-        try:
-            text_content = data.decode("utf-8")
-        except UnicodeDecodeError:
-            text_content = data.decode("latin-1")
+    builder = _CONTENT_BLOCK_BUILDERS.get(content_type)
+    if builder is None:
+        if not content_type.startswith("text/"):
+            return None
+        builder = _build_text_block
+    return builder(content_type, data, filename)
 
-        block = {
-            "type": "document",
-            "source": {
-                "type": "text",
-                "media_type": "text/plain",
-                "data": text_content,
-            },
-            "citations": {"enabled": True},
-        }
-        if filename:
-            block["title"] = filename
-        return block
-    return None
+
+async def build_attachment_content_block_async(
+    content_type: str,
+    data: bytes,
+    filename: str | None = None,
+) -> dict[str, Any] | None:
+    """Build an attachment content block, off the event loop for large payloads."""
+    if len(data) <= ATTACHMENT_OFFLOAD_THRESHOLD_BYTES:
+        return build_attachment_content_block(content_type, data, filename)
+    return await asyncio.to_thread(build_attachment_content_block, content_type, data, filename)
 
 
 async def fetch_attachment_bytes(cog, attachment: Attachment) -> bytes | None:
-    """Fetch raw bytes for a Discord attachment."""
-    session = await get_http_session(cog)
+    """Fetch raw bytes for a Discord attachment.
+
+    Goes through py-cord's own HTTP client so attachment downloads share the
+    bot's connection pool instead of opening a second one.
+    """
     try:
-        async with session.get(attachment.url) as response:
-            if response.status == 200:
-                return await response.read()
-            cog.logger.warning(
-                "Failed to fetch attachment %s: HTTP %s",
-                attachment.url,
-                response.status,
-            )
-    except aiohttp.ClientError as error:
+        return await attachment.read()
+    except (TimeoutError, HTTPException, aiohttp.ClientError) as error:
         cog.logger.warning("Error fetching attachment %s: %s", attachment.url, error)
     return None
 
 
 __all__ = [
+    "ATTACHMENT_OFFLOAD_THRESHOLD_BYTES",
     "SUPPORTED_DOCUMENT_TYPES",
     "SUPPORTED_IMAGE_TYPES",
     "build_attachment_content_block",
+    "build_attachment_content_block_async",
     "fetch_attachment_bytes",
     "infer_attachment_content_type",
 ]
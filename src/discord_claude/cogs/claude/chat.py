@@ -34,7 +34,7 @@ from discord_claude.util import (
     truncate_text,
 )
 
-from .attachments import build_attachment_content_block, fetch_attachment_bytes
+from .attachments import build_attachment_content_block_async, fetch_attachment_bytes
 from .embed_delivery import send_embed_batches
 from .embeds import (
     append_citations_embed,
@@ -50,6 +50,9 @@ from .responses import ParsedResponse, extract_response_content
 from .state import compact_conversation, create_button_view
 from .tool_registry import TOOL_REGISTRY, get_anthropic_tools
 
+# Discord shows a typing indicator for ~10s, so re-trigger just before it lapses.
+TYPING_INTERVAL_SECONDS = 8
+
 
 async def keep_typing(cog, channel) -> None:
     """Keep the Discord typing indicator alive while Claude is working."""
@@ -58,12 +61,32 @@ async def keep_typing(cog, channel) -> None:
         while True:
             async with channel.typing():
                 cog.logger.debug("Sent typing indicator to channel %s", channel.id)
-                await asyncio.sleep(5)
+                await asyncio.sleep(TYPING_INTERVAL_SECONDS)
     except asyncio.CancelledError:
         cog.logger.debug("Typing indicator cancelled for channel %s", channel.id)
         raise
 
 
+def start_typing(cog, channel) -> None:
+    """Acquire the channel's shared typing loop, starting it on first use."""
+    count = cog._typing_refcounts.get(channel.id, 0)
+    cog._typing_refcounts[channel.id] = count + 1
+    if count == 0:
+        cog._typing_tasks[channel.id] = asyncio.create_task(keep_typing(cog, channel))
+
+
+def stop_typing(cog, channel) -> None:
+    """Release the channel's shared typing loop, cancelling it on last release."""
+    count = cog._typing_refcounts.get(channel.id, 0)
+    if count > 1:
+        cog._typing_refcounts[channel.id] = count - 1
+        return
+    cog._typing_refcounts.pop(channel.id, None)
+    task = cog._typing_tasks.pop(channel.id, None)
+    if task is not None:
+        task.cancel()
+
+
 def handle_check_permissions(ctx: ApplicationContext) -> Any:
     """Check whether the bot can read the current server channel."""
     if ctx.guild is None or not hasattr(ctx.channel, "permissions_for"):
@@ -400,7 +423,7 @@ async def handle_new_message_in_conversation(cog, message, conversation: Convers
     messages = conversation.messages
 
     cog.logger.info("Handling new message in conversation %s.", params.conversation_id)
-    typing_task = None
+    typing_channel = None
     embeds = []
 
     try:
@@ -420,16 +443,21 @@ async def handle_new_message_in_conversation(cog, message, conversation: Convers
             )
             return
 
-        typing_task = asyncio.create_task(keep_typing(cog, message.channel))
+        start_typing(cog, message.channel)
+        typing_channel = message.channel
 
         user_content: list[dict[str, Any]] = []
         if message.content:
             user_content.append({"type": "text", "text": message.content})
-        if message.attachments:
-            for attachment in message.attachments:
-                attachment_data = await fetch_attachment_bytes(cog, attachment)
+        attachments = message.attachments
+        if attachments:
+            # Fetch concurrently; gather preserves order, and fetch failures come back as None.
+            fetch_results = await asyncio.gather(
+                *(fetch_attachment_bytes(cog, attachment) for attachment in attachments)
+            )
+            for attachment, attachment_data in zip(attachments, fetch_results, strict=True):
                 if attachment_data is not None:
-                    content_block = build_attachment_content_block(
+                    content_block = await build_attachment_content_block_async(
                         attachment.content_type or "",
                         attachment_data,
                         attachment.filename,
@@ -448,9 +476,9 @@ async def handle_new_message_in_conversation(cog, message, conversation: Convers
         conversation.touch()
         response_text = parsed.text
 
-        if typing_task:
-            typing_task.cancel()
-            typing_task = None
+        if typing_channel is not None:
+            stop_typing(cog, typing_channel)
+            typing_channel = None
 
         append_thinking_embeds(embeds, parsed.thinking)
         append_response_embeds(embeds, response_text)
@@ -533,15 +561,15 @@ async def handle_new_message_in_conversation(cog, message, conversation: Convers
                 logger=cog.logger,
             )
     finally:
-        if typing_task:
-            typing_task.cancel()
+        if typing_channel is not None:
+            stop_typing(cog, typing_channel)
 
 
 async def handle_on_message(cog, message) -> None:
-    """Process Discord messages that belong to active Claude conversations."""
-    if message.author == cog.bot.user:
-        return
+    """Process Discord messages that belong to active Claude conversations.
 
+    The caller (``ClaudeCog.on_message``) has already filtered out the bot's own messages.
+    """
     cog.logger.debug(
         "Received message from %s in channel %s: %r",
         message.author,
@@ -582,7 +610,7 @@ async def run_chat_command(
 ) -> None:
     """Run the /claude chat command."""
     await ctx.defer()
-    typing_task = None
+    typing_channel = None
 
     if ctx.channel is None:
         await send_embed_batches(
@@ -609,7 +637,8 @@ async def run_chat_command(
         return
 
     try:
-        typing_task = asyncio.create_task(keep_typing(cog, ctx.channel))
+        start_typing(cog, ctx.channel)
+        typing_channel = ctx.channel
 
         enabled_tools: list[str] = []
         if web_search:
@@ -662,7 +691,7 @@ async def run_chat_command(
         if attachment:
             attachment_data = await fetch_attachment_bytes(cog, attachment)
             if attachment_data is not None:
-                content_block = build_attachment_content_block(
+                content_block = await build_attachment_content_block_async(
                     attachment.content_type or "",
                     attachment_data,
                     attachment.filename,
@@ -815,8 +844,8 @@ async def run_chat_command(
                 logger=cog.logger,
             )
     finally:
-        if typing_task:
-            typing_task.cancel()
+        if typing_channel is not None:
+            stop_typing(cog, typing_channel)
 
 
 __all__ = [
@@ -828,5 +857,7 @@ __all__ = [
     "handle_on_message",
     "keep_typing",
     "run_chat_command",
+    "start_typing",
+    "stop_typing",
     "validate_request_configuration",
 ]
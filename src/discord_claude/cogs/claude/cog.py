@@ -41,8 +41,6 @@ from .client import (
     APIConnectionError,
     APIError,
     build_claude_client,
-    close_http_session,
-    get_http_session,
 )
 from .command_options import CHAT_MODEL_CHOICES, RESPONSE_EFFORT_CHOICES, TOOL_CHOICE_CHOICES
 from .embeds import (
@@ -103,13 +101,10 @@ class ClaudeCog(commands.Cog):
         self.views = {}
         self.last_view_messages = {}
         self.daily_costs: dict[tuple[int, str], tuple[float, datetime]] = {}
-        self._http_session = None
-        self._session_lock = asyncio.Lock()
+        self._typing_refcounts: dict[int, int] = {}
+        self._typing_tasks: dict[int, asyncio.Task[None]] = {}
         self._tool_handlers: dict[str, ToolHandler] = default_tool_handlers()
 
-    async def _get_http_session(self):
-        return await get_http_session(self)
-
     async def _compact_conversation(
         self,
         messages: list[dict[str, Any]],
@@ -156,7 +151,10 @@ class ClaudeCog(commands.Cog):
     def cog_unload(self):
         if self._runtime_cleanup_task.is_running():
             self._runtime_cleanup_task.cancel()
-        close_http_session(self)
+        for typing_task in self._typing_tasks.values():
+            typing_task.cancel()
+        self._typing_tasks.clear()
+        self._typing_refcounts.clear()
 
     async def _call_api_with_tool_loop(
         self,
@@ -221,6 +219,9 @@ class ClaudeCog(commands.Cog):
 
     @commands.Cog.listener()
     async def on_message(self, message):
+        # Skip the bot's own messages before binding a request id.
+        if message.author == self.bot.user:
+            return
         bind_request_id()
         await handle_on_message(self, message)
 
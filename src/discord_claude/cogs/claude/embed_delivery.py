@@ -85,6 +85,8 @@ async def send_embed_batches(
     ]
     sent_file_ids: set[int] = set()
     final_message = None
+    # Per-batch char counts for failure logging; computed once, only if a send fails.
+    batch_chars: list[int] | None = None
 
     for index, batch in enumerate(batches):
         is_first = index == 0
@@ -110,7 +112,9 @@ async def send_embed_batches(
         try:
             final_message = await send(**send_kwargs)
         except HTTPException as error:
-            _log_embed_send_failure(logger, error, batch, batches)
+            if logger is not None and batch_chars is None:
+                batch_chars = [sum(count_embed_chars(item) for item in entry) for entry in batches]
+            _log_embed_send_failure(logger, error, batch, index, batch_chars)
             final_message = await _send_plain_text_fallback(
                 send,
                 batch,
@@ -255,18 +259,18 @@ def _log_embed_send_failure(
     logger: Any,
     error: HTTPException,
     batch: list[Embed],
-    batches: list[list[Embed]],
+    batch_index: int,
+    batch_chars: list[int] | None,
 ) -> None:
-    if logger is None:
+    if logger is None or batch_chars is None:
         return
-    batch_sizes = [sum(count_embed_chars(embed) for embed in item) for item in batches]
     logger.warning(
         "Discord rejected embed batch; falling back to plain text: %s "
         "(failed_batch_embeds=%s failed_batch_chars=%s all_batch_chars=%s)",
         error,
         len(batch),
-        sum(count_embed_chars(embed) for embed in batch),
-        batch_sizes,
+        batch_chars[batch_index],
+        batch_chars,
     )
 
 
@@ -6,6 +6,8 @@ from discord_claude.util import chunk_text
 
 from .responses import ParsedResponse
 
+_EXCESS_NEWLINES_RE = re.compile(r"\n{3,}")
+
 
 def _fit_markdown_sections(
     sections: list[tuple[str | None, list[str]]],
@@ -48,14 +50,22 @@ def append_thinking_embeds(embeds: list[Embed], thinking_text: str) -> None:
 
 def append_response_embeds(embeds: list[Embed], response_text: str) -> None:
     """Append response text as Discord embeds, handling chunking for long responses."""
-    response_text = re.sub(r"\n{3,}", "\n\n", response_text)
+    response_text = _EXCESS_NEWLINES_RE.sub("\n\n", response_text)
+    if not response_text:
+        return
+
+    # Most replies fit in one embed; skip the chunking loop entirely for them.
+    if len(response_text) <= 3500:
+        embeds.append(Embed(title="Response", description=response_text, color=Colour.orange()))
+        return
 
+    colour = Colour.orange()
     for index, chunk in enumerate(chunk_text(response_text, 3500), start=1):
         embeds.append(
             Embed(
-                title="Response" + (f" (Part {index})" if index > 1 else ""),
+                title=f"Response (Part {index})" if index > 1 else "Response",
                 description=chunk,
-                color=Colour.orange(),
+                color=colour,
             )
         )
 
@@ -23,7 +23,7 @@ from .tool_registry import TOOL_REGISTRY, get_tool_select_options
 
 async def _send_interaction_error(interaction: Interaction, context: str, error: Exception) -> None:
     """Log an error and send the user a safe ephemeral message."""
-    logging.error(f"Error in {context}: {error}", exc_info=True)
+    logging.error("Error in %s: %s", context, error, exc_info=True)
     msg = f"An error occurred while {context}."
     if interaction.response.is_done():
         await interaction.followup.send(msg, ephemeral=True)
@@ -218,7 +218,8 @@ class ButtonView(View):
             await interaction.followup.send("Response regenerated.", ephemeral=True, delete_after=3)
         except Exception as error:
             logging.error(
-                f"Error in regenerate_button: {error}",
+                "Error in regenerate_button: %s",
+                error,
                 exc_info=True,
             )
 
@@ -83,7 +83,7 @@ def execute_memory_operation(user_id: int, tool_input: dict[str, Any]) -> str:
     except ValueError as e:
         return f"Error: {e}"
     except Exception as e:
-        logger.error(f"Memory operation error: {e}", exc_info=True)
+        logger.error("Memory operation error: %s", e, exc_info=True)
         return f"Error: {e}"
 
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any, Literal, Protocol, TypedDict
@@ -291,18 +292,24 @@ class ToolHandler(Protocol):
     async def execute(self, tool_input: dict[str, Any], user_id: int) -> str: ...
 
 
-def chunk_text(text: str, chunk_size: int = CHUNK_TEXT_SIZE) -> list[str]:
+def chunk_text(text: str, chunk_size: int = CHUNK_TEXT_SIZE) -> Iterator[str]:
     """
-    Splits a string into chunks of a specified size.
+    Lazily split a string into chunks of a specified size.
 
     Args:
         text: The string to split.
         chunk_size: The maximum size of each chunk.
 
-    Returns:
-        A list of strings, where each string is a chunk of the original text.
+    Yields:
+        Successive chunks of the original text; nothing for an empty string.
     """
-    return [text[i : i + chunk_size] for i in range(0, len(text), chunk_size)]
+    length = len(text)
+    if length <= chunk_size:
+        if text:
+            yield text
+        return
+    for i in range(0, length, chunk_size):
+        yield text[i : i + chunk_size]
 
 
 def truncate_text(text: str | None, max_length: int, suffix: str = "...") -> str | None:
@@ -1,4 +1,6 @@
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from typing import Any, NamedTuple
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
@@ -10,20 +12,90 @@ def _set_required_env_vars(monkeypatch):
     monkeypatch.setenv("ANTHROPIC_API_KEY", "dummy-key")
 
 
+class RecordedCall(NamedTuple):
+    """``(args, kwargs)`` pair, indexable like ``Mock.call_args``."""
+
+    args: tuple[Any, ...]
+    kwargs: dict[str, Any]
+
+
+class AsyncRecorder:
+    """Awaitable stub that records calls; a lighter stand-in for assertion-only AsyncMocks."""
+
+    __slots__ = ("calls", "return_value")
+
+    def __init__(self, return_value=None):
+        self.calls: list[RecordedCall] = []
+        self.return_value = return_value
+
+    async def __call__(self, *args, **kwargs):
+        self.calls.append(RecordedCall(args, kwargs))
+        return self.return_value
+
+    @property
+    def call_args(self):
+        return self.calls[-1] if self.calls else None
+
+    @property
+    def await_count(self):
+        return len(self.calls)
+
+    def assert_called(self):
+        assert self.calls, "Expected the recorder to have been called."
+
+    def assert_not_called(self):
+        assert not self.calls, f"Expected no calls. Called {len(self.calls)} times."
+
+    def assert_awaited_once(self):
+        assert len(self.calls) == 1, f"Expected one await. Awaited {len(self.calls)} times."
+
+    def reset_mock(self):
+        self.calls.clear()
+
+
+# Long-lived author/channel doubles are spec_set so attribute typos fail loudly and
+# every attribute the code touches is created up front rather than on first access.
+_AUTHOR_ATTRS = ("id", "name")
+
+
+def _reset_shared_double(double, baseline: dict):
+    """Clear a shared test double's call history and restore the attributes tests may overwrite.
+
+    ``baseline`` maps dotted attribute paths to values, parents before children.
+    """
+    if isinstance(double, Mock):
+        double.reset_mock()
+    for path, value in baseline.items():
+        *parents, name = path.split(".")
+        target = double
+        for parent in parents:
+            target = getattr(target, parent)
+        if isinstance(value, (Mock, AsyncRecorder)):
+            value.reset_mock()
+        setattr(target, name, value)
+    return double
+
+
+@pytest.fixture(scope="module")
+def _shared_bot():
+    bot = SimpleNamespace()
+    baseline = {
+        "user": SimpleNamespace(),
+        "user.id": 123456789,
+        "owner_id": 987654321,
+        "sync_commands": AsyncRecorder(),
+    }
+    return _reset_shared_double(bot, baseline), baseline
+
+
 @pytest.fixture
-def mock_bot():
+def mock_bot(_shared_bot):
     """Create a mock Discord bot instance."""
-    bot = MagicMock()
-    bot.user = MagicMock()
-    bot.user.id = 123456789
-    bot.owner_id = 987654321
-    bot.sync_commands = AsyncMock()
-    return bot
+    return _reset_shared_double(*_shared_bot)
 
 
-@pytest.fixture
-def mock_anthropic_client():
-    """Create a mock Anthropic client."""
+@pytest.fixture(scope="module")
+def _shared_anthropic_client():
     with patch("discord_claude.cogs.claude.client.AsyncAnthropic") as mock_class:
         client = AsyncMock()
         mock_class.return_value = client
@@ -41,54 +113,110 @@ def mock_anthropic_client():
 
         client.messages.create = AsyncMock(return_value=mock_response)
 
-        yield client
+        yield client, mock_response
 
 
 @pytest.fixture
-def mock_discord_context():
+def mock_anthropic_client(_shared_anthropic_client):
+    """Create a mock Anthropic client."""
+    client, mock_response = _shared_anthropic_client
+    client.messages.create.reset_mock(return_value=True, side_effect=True)
+    client.messages.create.return_value = mock_response
+    return client
+
+
+@pytest.fixture(scope="module")
+def _shared_anthropic_client_callonly():
+    client = AsyncMock()
+    client.messages.create = AsyncMock(return_value=None)
+    return client
+
+
+@pytest.fixture
+def mock_anthropic_client_callonly(_shared_anthropic_client_callonly):
+    """Anthropic client mock with no response configured, for call_args-only assertions."""
+    _shared_anthropic_client_callonly.messages.create.reset_mock()
+    return _shared_anthropic_client_callonly
+
+
+@pytest.fixture(scope="module")
+def _shared_discord_context():
+    # Authors stay MagicMocks: the cog keys per-user state by the author object.
+    ctx = SimpleNamespace()
+    baseline = {
+        "author": MagicMock(spec_set=_AUTHOR_ATTRS),
+        "author.id": 111222333,
+        "author.name": "TestUser",
+        "channel": MagicMock(spec_set=("id", "typing", "permissions_for")),
+        "channel.id": 444555666,
+        "channel.typing": MagicMock(),
+        "interaction": SimpleNamespace(),
+        "interaction.id": 777888999,
+        "defer": AsyncRecorder(),
+        "send_followup": AsyncRecorder(),
+        "respond": AsyncRecorder(),
+    }
+    return _reset_shared_double(ctx, baseline), baseline
+
+
+@pytest.fixture
+def mock_discord_context(_shared_discord_context):
     """Create a mock Discord application context."""
-    ctx = AsyncMock()
-    ctx.author = MagicMock()
-    ctx.author.id = 111222333
-    ctx.author.name = "TestUser"
-    ctx.channel = MagicMock()
-    ctx.channel.id = 444555666
-    ctx.interaction = MagicMock()
-    ctx.interaction.id = 777888999
-    ctx.defer = AsyncMock()
-    ctx.send_followup = AsyncMock()
-    ctx.respond = AsyncMock()
-    return ctx
+    return _reset_shared_double(*_shared_discord_context)
 
 
 @pytest.fixture
-def mock_discord_message():
+def typing_cm():
+    """Async context manager double for ``channel.typing()``."""
+    cm = MagicMock()
+    cm.__aenter__ = AsyncMock(return_value=None)
+    cm.__aexit__ = AsyncMock(return_value=None)
+    return cm
+
+
+@pytest.fixture(scope="module")
+def _shared_discord_message():
+    message = SimpleNamespace()
+    baseline = {
+        "author": MagicMock(spec_set=_AUTHOR_ATTRS),
+        "author.id": 111222333,
+        "author.name": "TestUser",
+        "channel": MagicMock(spec_set=("id", "typing")),
+        "channel.id": 444555666,
+        "channel.typing": MagicMock(),
+        "content": "Hello Claude!",
+        # Immutable, so restoring the baseline can't leak appends between tests.
+        "attachments": (),
+        "reply": AsyncRecorder(),
+    }
+    return _reset_shared_double(message, baseline), baseline
+
+
+@pytest.fixture
+def mock_discord_message(_shared_discord_message):
     """Create a mock Discord message."""
-    message = MagicMock()
-    message.author = MagicMock()
-    message.author.id = 111222333
-    message.author.name = "TestUser"
-    message.channel = MagicMock()
-    message.channel.id = 444555666
-    message.content = "Hello Claude!"
-    message.attachments = []
-    message.reply = AsyncMock()
-    return message
+    return _reset_shared_double(*_shared_discord_message)
+
+
+@pytest.fixture(scope="module")
+def _shared_attachment():
+    attachment = SimpleNamespace(
+        url="https://example.com/image.png",
+        content_type="image/png",
+        filename="image.png",
+    )
+    return attachment, dict(vars(attachment))
 
 
 @pytest.fixture
-def mock_attachment():
+def mock_attachment(_shared_attachment):
     """Create a mock Discord attachment."""
-    attachment = MagicMock()
-    attachment.url = "https://example.com/image.png"
-    attachment.content_type = "image/png"
-    attachment.filename = "image.png"
-    return attachment
+    return _reset_shared_double(*_shared_attachment)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_messages():
-    """Sample conversation messages."""
+    """Sample conversation messages (shared; do not mutate)."""
     return [
         {"role": "user", "content": "Hello!"},
         {"role": "assistant", "content": "Hi there! How can I help you?"},
@@ -96,9 +224,30 @@ def sample_messages():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sample_image_messages():
+    """Single user turn carrying a 1x1 PNG image block (shared; do not mutate)."""
+    return [
+        {
+            "role": "user",
+            "content": [
+                {
+                    "type": "image",
+                    "source": {
+                        "type": "base64",
+                        "media_type": "image/png",
+                        "data": "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNk+M9QDwADhgGAWjR9awAAAABJRU5ErkJggg==",
+                    },
+                },
+                {"type": "text", "text": "What's in this image?"},
+            ],
+        }
+    ]
+
+
+@pytest.fixture(scope="session")
 def sample_api_response():
-    """Sample Anthropic API response structure."""
+    """Sample Anthropic API response structure (shared; do not mutate)."""
     return {
         "id": "msg_01XFDUDYJgAACzvnptvVoYEL",
         "type": "message",
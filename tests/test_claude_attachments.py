@@ -1,7 +1,17 @@
+import asyncio
 import base64
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
+import pytest
+from discord import HTTPException
 
 from discord_claude.cogs.claude.attachments import (
+    ATTACHMENT_OFFLOAD_THRESHOLD_BYTES,
+    _b2a_base64_as_string,
     build_attachment_content_block,
+    build_attachment_content_block_async,
+    fetch_attachment_bytes,
     infer_attachment_content_type,
 )
 
@@ -12,6 +22,11 @@ WEBP_BYTES = b"RIFF" + b"\x00\x00\x00\x00" + b"WEBP" + b"VP8 payload"
 PDF_BYTES = b"%PDF-1.7\n%payload"
 
 
+def test_stdlib_base64_fallback_matches_b64encode():
+    for payload in (b"", b"a", b"ab", b"abc", PNG_BYTES, bytes(range(256)) * 5):
+        assert _b2a_base64_as_string(payload) == base64.b64encode(payload).decode("ascii")
+
+
 class TestInferAttachmentContentType:
     def test_png_magic_bytes_override_declared_type(self):
         """PNG bytes win even when Discord lies and says image/jpeg."""
@@ -69,6 +84,7 @@ class TestBuildAttachmentContentBlock:
         assert block is not None
         assert block["type"] == "document"
         assert block["source"]["media_type"] == "application/pdf"
+        assert base64.b64decode(block["source"]["data"]) == PDF_BYTES
         assert block["title"] == "report.pdf"
 
     def test_mislabeled_image_as_octet_stream_still_routes_to_image(self):
@@ -85,6 +101,76 @@ class TestBuildAttachmentContentBlock:
         assert block["source"]["type"] == "text"
         assert block["source"]["data"] == "hello world"
 
+    def test_non_ascii_text_decodes_as_utf8_then_latin1(self):
+        utf8_block = build_attachment_content_block("text/plain", "café".encode(), "a.txt")
+        latin1_block = build_attachment_content_block("text/plain", b"caf\xe9", "b.txt")
+        assert utf8_block is not None
+        assert latin1_block is not None
+        assert utf8_block["source"]["data"] == "café"
+        assert latin1_block["source"]["data"] == "café"
+
+    def test_other_text_subtypes_route_to_text_document(self):
+        block = build_attachment_content_block("text/x-python", b"print('hi')", "main.py")
+        assert block is not None
+        assert block["source"]["type"] == "text"
+        assert block["source"]["data"] == "print('hi')"
+        assert block["title"] == "main.py"
+
     def test_unsupported_type_returns_none(self):
         block = build_attachment_content_block("application/zip", b"PK\x03\x04zipdata", "a.zip")
         assert block is None
+
+
+class TestBuildAttachmentContentBlockAsync:
+    async def test_small_payload_builds_inline(self):
+        with patch("discord_claude.cogs.claude.attachments.asyncio.to_thread") as to_thread:
+            block = await build_attachment_content_block_async("image/png", PNG_BYTES, "a.png")
+        to_thread.assert_not_called()
+        assert block == build_attachment_content_block("image/png", PNG_BYTES, "a.png")
+
+    async def test_large_payload_builds_on_worker_thread(self):
+        data = PDF_BYTES + b"\0" * ATTACHMENT_OFFLOAD_THRESHOLD_BYTES
+        with patch(
+            "discord_claude.cogs.claude.attachments.asyncio.to_thread",
+            wraps=asyncio.to_thread,
+        ) as to_thread:
+            block = await build_attachment_content_block_async("application/pdf", data, "big.pdf")
+        to_thread.assert_called_once()
+        assert block is not None
+        assert block["source"]["data"] == base64.b64encode(data).decode("ascii")
+
+
+class TestFetchAttachmentBytes:
+    async def test_reads_through_discord_client(self):
+        cog = MagicMock()
+        attachment = MagicMock(url="https://cdn.example/a.png")
+        attachment.read = AsyncMock(return_value=PNG_BYTES)
+
+        assert await fetch_attachment_bytes(cog, attachment) == PNG_BYTES
+        attachment.read.assert_awaited_once_with()
+        cog.logger.warning.assert_not_called()
+
+    async def test_http_error_is_logged_and_returns_none(self):
+        cog = MagicMock()
+        attachment = MagicMock(url="https://cdn.example/a.png")
+        attachment.read = AsyncMock(
+            side_effect=HTTPException(MagicMock(status=404, reason="Not Found"), "missing")
+        )
+
+        assert await fetch_attachment_bytes(cog, attachment) is None
+        cog.logger.warning.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            pytest.param(aiohttp.ClientConnectionError("connection reset"), id="client_error"),
+            pytest.param(TimeoutError(), id="timeout"),
+        ],
+    )
+    async def test_transport_error_is_logged_and_returns_none(self, error):
+        cog = MagicMock()
+        attachment = MagicMock(url="https://cdn.example/a.png")
+        attachment.read = AsyncMock(side_effect=error)
+
+        assert await fetch_attachment_bytes(cog, attachment) is None
+        cog.logger.warning.assert_called_once()
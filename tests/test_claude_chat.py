@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -792,3 +793,100 @@ class TestRunChatCommand:
         assert parsed.context_compacted is False
         assert parsed.context_warning is True
         cog.client.beta.messages.create.assert_called_once()
+
+
+class TestHandleNewMessageInConversation:
+    @pytest.fixture
+    def cog(self, mock_bot):
+        with patch("discord_claude.cogs.claude.client.AsyncAnthropic") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            from discord_claude.cogs.claude.cog import ClaudeCog
+
+            cog = ClaudeCog(bot=mock_bot)
+            cog.client = mock_client
+            return cog
+
+    async def test_attachments_are_fetched_concurrently_in_order(self, cog, mock_discord_message):
+        """Multiple attachments are fetched in parallel; failures are skipped."""
+        from discord_claude.cogs.claude.responses import ParsedResponse
+        from discord_claude.util import ChatCompletionParameters, Conversation
+
+        attachments = []
+        for name in ("a.txt", "b.txt", "c.txt"):
+            attachment = MagicMock()
+            attachment.url = f"https://example.com/{name}"
+            attachment.content_type = "text/plain"
+            attachment.filename = name
+            attachments.append(attachment)
+        mock_discord_message.attachments = attachments
+
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_fetch(_cog, attachment):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if attachment.filename == "b.txt":
+                return None  # fetch_attachment_bytes logs and swallows fetch errors
+            return attachment.filename.encode()
+
+        params = ChatCompletionParameters(
+            model="claude-haiku-4-5",
+            conversation_starter=mock_discord_message.author,
+            channel_id=mock_discord_message.channel.id,
+            conversation_id=123,
+        )
+        conversation = Conversation(params=params, messages=[])
+
+        with (
+            patch("discord_claude.cogs.claude.chat.fetch_attachment_bytes", fake_fetch),
+            patch("discord_claude.cogs.claude.chat.keep_typing", AsyncMock()),
+            patch(
+                "discord_claude.cogs.claude.chat.call_api_with_tool_loop",
+                AsyncMock(return_value=ParsedResponse(text="ok")),
+            ),
+        ):
+            await cog.handle_new_message_in_conversation(mock_discord_message, conversation)
+
+        assert max_in_flight == 3
+        user_content = conversation.messages[0]["content"]
+        assert [block.get("title") for block in user_content[1:]] == ["a.txt", "c.txt"]
+
+
+class TestSharedTypingIndicator:
+    async def test_concurrent_requests_share_one_typing_loop(self):
+        from discord_claude.cogs.claude.chat import start_typing, stop_typing
+
+        cog = MagicMock()
+        cog._typing_refcounts = {}
+        cog._typing_tasks = {}
+        channel = MagicMock(id=444555666)
+        started = asyncio.Event()
+
+        async def fake_keep_typing(_cog, _channel):
+            started.set()
+            await asyncio.Event().wait()
+
+        with patch("discord_claude.cogs.claude.chat.keep_typing", fake_keep_typing):
+            start_typing(cog, channel)
+            start_typing(cog, channel)
+            await started.wait()
+
+            task = cog._typing_tasks[channel.id]
+            assert cog._typing_refcounts[channel.id] == 2
+
+            stop_typing(cog, channel)
+            assert cog._typing_tasks[channel.id] is task
+            assert not task.cancelled()
+
+            stop_typing(cog, channel)
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        assert cog._typing_tasks == {}
+        assert cog._typing_refcounts == {}
@@ -4,11 +4,13 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from discord_claude.cogs.claude.cog import ClaudeCog
 from discord_claude.cogs.claude.command_options import (
     CHAT_MODEL_CHOICES,
     RESPONSE_EFFORT_CHOICES,
     TOOL_CHOICE_CHOICES,
 )
+from discord_claude.util import ChatCompletionParameters, Conversation
 
 
 def _serialize_command_group_payload(group):
@@ -47,28 +49,45 @@ def _make_usage(**kwargs):
 class TestClaudeCog:
     """Tests for the Claude Discord cog."""
 
-    @pytest.fixture
-    def cog(self, mock_bot):
-        """Create a ClaudeCog instance with mocked dependencies."""
-        with patch("discord_claude.cogs.claude.client.AsyncAnthropic") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_response = MagicMock()
-            text_block = MagicMock()
-            text_block.type = "text"
-            text_block.text = "Test response"
-            text_block.citations = None
-            mock_response.content = [text_block]
-            mock_response.id = "msg_test123"
-            mock_response.stop_reason = "end_turn"
-            mock_response.usage = _make_usage()
-            mock_client.messages.create = AsyncMock(return_value=mock_response)
-            mock_client_class.return_value = mock_client
-
-            from discord_claude.cogs.claude.cog import ClaudeCog
-
-            cog = ClaudeCog(bot=mock_bot)
-            cog.client = mock_client
-            return cog
+    @pytest.fixture(scope="module")
+    def cog_client(self):
+        """Mock Anthropic client shared by every test in the module."""
+        mock_client = AsyncMock()
+        mock_response = MagicMock()
+        text_block = MagicMock()
+        text_block.type = "text"
+        text_block.text = "Test response"
+        text_block.citations = None
+        mock_response.content = [text_block]
+        mock_response.id = "msg_test123"
+        mock_response.stop_reason = "end_turn"
+        mock_response.usage = _make_usage()
+        mock_client.messages.create = AsyncMock(return_value=mock_response)
+        return mock_client
+
+    @pytest.fixture(scope="module")
+    def cog(self, _shared_bot, cog_client):
+        """Create a ClaudeCog instance with mocked dependencies, once per module."""
+        bot, _ = _shared_bot
+        # The autouse env-var fixture is function-scoped, so set the vars here too.
+        with (
+            pytest.MonkeyPatch.context() as monkeypatch,
+            patch("discord_claude.cogs.claude.client.AsyncAnthropic", return_value=cog_client),
+        ):
+            monkeypatch.setenv("BOT_TOKEN", "dummy-token")
+            monkeypatch.setenv("ANTHROPIC_API_KEY", "dummy-key")
+            cog = ClaudeCog(bot=bot)
+        cog.client = cog_client
+        return cog
+
+    @pytest.fixture(autouse=True)
+    def _reset_cog_state(self, cog, cog_client):
+        cog.conversations.clear()
+        cog.views.clear()
+        cog.last_view_messages.clear()
+        cog.daily_costs.clear()
+        cog.client = cog_client
+        cog_client.messages.create.reset_mock()
 
     async def test_cog_initialization(self, cog, mock_bot):
         """Test that the cog initializes correctly."""
@@ -146,14 +165,11 @@ class TestClaudeCog:
         assert user not in cog.views
 
     async def test_chat_creates_conversation(
-        self, cog, mock_discord_context, mock_anthropic_client
+        self, cog, mock_discord_context, mock_anthropic_client, typing_cm
     ):
         """Test that chat command creates a conversation entry."""
         cog.client = mock_anthropic_client
-
-        mock_discord_context.channel.typing = MagicMock()
-        mock_discord_context.channel.typing.return_value.__aenter__ = AsyncMock()
-        mock_discord_context.channel.typing.return_value.__aexit__ = AsyncMock()
+        mock_discord_context.channel.typing = MagicMock(return_value=typing_cm)
 
         await cog.chat.callback(
             cog,
@@ -167,8 +183,6 @@ class TestClaudeCog:
 
     async def test_chat_prevents_duplicate_conversations(self, cog, mock_discord_context):
         """Test that users can't start multiple conversations in the same channel."""
-        from discord_claude.util import ChatCompletionParameters, Conversation
-
         existing_params = ChatCompletionParameters(
             model="claude-sonnet-4",
             conversation_starter=mock_discord_context.author,
@@ -192,31 +206,60 @@ class TestClaudeCog:
         """Test that the bot ignores its own messages."""
         mock_discord_message.author = cog.bot.user
 
-        await cog.on_message(mock_discord_message)
+        with (
+            patch("discord_claude.cogs.claude.cog.bind_request_id") as mock_bind,
+            patch("discord_claude.cogs.claude.cog.handle_on_message") as mock_handle,
+        ):
+            await cog.on_message(mock_discord_message)
 
+        mock_bind.assert_not_called()
+        mock_handle.assert_not_called()
         mock_discord_message.reply.assert_not_called()
 
-    async def test_keep_typing_can_be_cancelled(self, cog, mock_discord_context):
+    async def test_on_message_dispatches_by_author_and_channel(self, cog, mock_discord_message):
+        """Followups route via the (user_id, channel_id) key, not a channel scan."""
+        params = ChatCompletionParameters(
+            model="claude-sonnet-4",
+            conversation_starter=mock_discord_message.author,
+            channel_id=mock_discord_message.channel.id,
+            conversation_id=123,
+        )
+        conversation = Conversation(params=params, messages=[])
+        cog.conversations[(mock_discord_message.author.id, mock_discord_message.channel.id)] = (
+            conversation
+        )
+
+        with patch(
+            "discord_claude.cogs.claude.chat.handle_new_message_in_conversation",
+            new_callable=AsyncMock,
+        ) as mock_handle:
+            await cog.on_message(mock_discord_message)
+            mock_handle.assert_awaited_once_with(cog, mock_discord_message, conversation)
+
+            mock_handle.reset_mock()
+            mock_discord_message.author.id = 999999999
+            await cog.on_message(mock_discord_message)
+            mock_handle.assert_not_awaited()
+
+    async def test_keep_typing_can_be_cancelled(self, cog, mock_discord_context, typing_cm):
         """Test that the typing indicator can be cancelled."""
-        typing_cm = MagicMock()
-        typing_cm.__aenter__ = AsyncMock(return_value=None)
-        typing_cm.__aexit__ = AsyncMock(return_value=None)
+        entered = asyncio.Event()
+        typing_cm.__aenter__.side_effect = lambda *_: entered.set()
         mock_discord_context.channel.typing = MagicMock(return_value=typing_cm)
 
         task = asyncio.create_task(cog.keep_typing(mock_discord_context.channel))
 
-        await asyncio.sleep(0.01)
+        await entered.wait()
         task.cancel()
 
         with pytest.raises(asyncio.CancelledError):
             await task
+        typing_cm.__aexit__.assert_awaited_once()
 
     async def test_handle_new_message_rejects_invalid_tool_choice_before_api_call(
         self, cog, mock_discord_message
     ):
         """Invalid thinking/tool_choice combos fail fast without hitting Anthropic."""
-        from discord_claude.util import ChatCompletionParameters, Conversation
-
         params = ChatCompletionParameters(
             model="claude-opus-4-6",
             conversation_starter=mock_discord_message.author,
@@ -1,62 +1,91 @@
+import pytest
+
+from discord_claude.cogs.claude.embeds import (
+    append_citations_embed,
+    append_compaction_embed,
+    append_context_warning_embed,
+    append_fallback_embed,
+    append_pricing_embed,
+    append_response_embeds,
+    append_stop_reason_embed,
+    append_thinking_embeds,
+)
 from discord_claude.cogs.claude.responses import ParsedResponse
 
+_LONG_TEXT = "a" * 4000
+
 
 class TestAppendResponseEmbeds:
     """Tests for the append_response_embeds helper."""
 
     def test_long_response_is_preserved_for_delivery_batching(self):
-        from discord_claude.cogs.claude.embeds import append_response_embeds
-
         embeds = []
         long_text = "A" * 25000
         append_response_embeds(embeds, long_text)
 
         assert "".join(embed.description for embed in embeds) == long_text
 
+    def test_short_response_is_a_single_unnumbered_embed(self):
+        embeds = []
+        append_response_embeds(embeds, "Hello!")
 
-class TestAppendThinkingEmbeds:
-    """Tests for the append_thinking_embeds helper."""
-
-    def test_no_thinking(self):
-        from discord_claude.cogs.claude.embeds import append_thinking_embeds
+        assert len(embeds) == 1
+        assert embeds[0].title == "Response"
+        assert embeds[0].description == "Hello!"
 
+    def test_long_response_parts_are_numbered_and_blank_runs_collapsed(self):
         embeds = []
-        append_thinking_embeds(embeds, "")
-        assert len(embeds) == 0
+        append_response_embeds(embeds, "x\n\n\n\ny" + "z" * 7000)
 
-    def test_with_thinking(self):
-        from discord_claude.cogs.claude.embeds import append_thinking_embeds
+        assert [embed.title for embed in embeds] == [
+            "Response",
+            "Response (Part 2)",
+            "Response (Part 3)",
+        ]
+        assert embeds[0].description.startswith("x\n\ny")
 
+    def test_empty_response_adds_no_embeds(self):
         embeds = []
-        append_thinking_embeds(embeds, "Some reasoning here")
-        assert len(embeds) == 1
-        assert embeds[0].title == "Thinking"
-        assert embeds[0].description == "||Some reasoning here||"
+        append_response_embeds(embeds, "")
 
-    def test_long_thinking_truncated(self):
-        from discord_claude.cogs.claude.embeds import append_thinking_embeds
+        assert embeds == []
 
+
+class TestAppendThinkingEmbeds:
+    """Tests for the append_thinking_embeds helper."""
+
+    @pytest.mark.parametrize(
+        ("thinking_text", "expected_description"),
+        [
+            pytest.param("", None, id="no_thinking"),
+            pytest.param("Some reasoning here", "||Some reasoning here||", id="with_thinking"),
+            pytest.param(
+                _LONG_TEXT,
+                "||" + _LONG_TEXT[:3450] + "\n\n... [thinking truncated]||",
+                id="long_thinking_truncated",
+            ),
+        ],
+    )
+    def test_thinking_embed(self, thinking_text, expected_description):
         embeds = []
-        long_text = "a" * 4000
-        append_thinking_embeds(embeds, long_text)
-        assert len(embeds) == 1
-        assert len(embeds[0].description) < 3600
-        assert "[thinking truncated]" in embeds[0].description
+        append_thinking_embeds(embeds, thinking_text)
+        if expected_description is None:
+            assert embeds == []
+        else:
+            assert len(embeds) == 1
+            assert embeds[0].title == "Thinking"
+            assert embeds[0].description == expected_description
 
 
 class TestAppendCitationsEmbed:
     """Tests for the append_citations_embed helper."""
 
     def test_no_citations(self):
-        from discord_claude.cogs.claude.embeds import append_citations_embed
-
         embeds = []
         append_citations_embed(embeds, [])
         assert len(embeds) == 0
 
     def test_with_web_citations(self):
-        from discord_claude.cogs.claude.embeds import append_citations_embed
-
         embeds = []
         citations = [
             {"kind": "web", "url": "https://example.com/1", "title": "First Source"},
@@ -69,8 +98,6 @@ class TestAppendCitationsEmbed:
         assert "[Second Source](https://example.com/2)" in embeds[0].description
 
     def test_web_citations_capped_at_20(self):
-        from discord_claude.cogs.claude.embeds import append_citations_embed
-
         embeds = []
         citations = [
             {"kind": "web", "url": f"https://example.com/{i}", "title": f"Source {i}"}
@@ -82,8 +109,6 @@ class TestAppendCitationsEmbed:
         assert "Source 20" not in embeds[0].description
 
     def test_long_web_links_are_kept_complete_or_omitted(self):
-        from discord_claude.cogs.claude.embeds import append_citations_embed
-
         first_url = "https://example.com/" + "a" * 3500
         second_url = "https://example.org/" + "b" * 1000
         embeds = []
@@ -100,8 +125,6 @@ class TestAppendCitationsEmbed:
         assert len(embeds[0].description) <= 4000
 
     def test_with_document_citations(self):
-        from discord_claude.cogs.claude.embeds import append_citations_embed
-
         embeds = []
         citations = [
             {
@@ -125,8 +148,6 @@ class TestAppendCitationsEmbed:
         assert "> — *Nature Doc*\n\n> Water is essential." in embeds[0].description
 
     def test_mixed_web_and_document_citations(self):
-        from discord_claude.cogs.claude.embeds import append_citations_embed
-
         embeds = []
         citations = [
             {"kind": "web", "url": "https://example.com", "title": "Web Source"},
@@ -147,39 +168,29 @@ class TestAppendStopReasonEmbed:
     """Tests for the append_stop_reason_embed helper."""
 
     def test_end_turn_no_embed(self):
-        from discord_claude.cogs.claude.embeds import append_stop_reason_embed
-
         embeds = []
         append_stop_reason_embed(embeds, "end_turn")
         assert len(embeds) == 0
 
     def test_max_tokens(self):
-        from discord_claude.cogs.claude.embeds import append_stop_reason_embed
-
         embeds = []
         append_stop_reason_embed(embeds, "max_tokens")
         assert len(embeds) == 1
         assert embeds[0].title == "Response Truncated"
 
     def test_model_context_window_exceeded(self):
-        from discord_claude.cogs.claude.embeds import append_stop_reason_embed
-
         embeds = []
         append_stop_reason_embed(embeds, "model_context_window_exceeded")
         assert len(embeds) == 1
         assert embeds[0].title == "Context Limit Reached"
 
     def test_refusal(self):
-        from discord_claude.cogs.claude.embeds import append_stop_reason_embed
-
         embeds = []
         append_stop_reason_embed(embeds, "refusal")
         assert len(embeds) == 1
         assert embeds[0].title == "Request Declined"
 
     def test_refusal_with_stop_details(self):
-        from discord_claude.cogs.claude.embeds import append_stop_reason_embed
-
         embeds = []
         append_stop_reason_embed(
             embeds,
@@ -196,8 +207,6 @@ class TestAppendStopReasonEmbed:
         assert "harmful cyber guidance" in embeds[0].description
 
     def test_pause_turn_no_embed(self):
-        from discord_claude.cogs.claude.embeds import append_stop_reason_embed
-
         embeds = []
         append_stop_reason_embed(embeds, "pause_turn")
         assert len(embeds) == 0
@@ -223,8 +232,6 @@ class TestAppendPricingEmbed:
         return parsed
 
     def test_basic_pricing_embed(self):
-        from discord_claude.cogs.claude.embeds import append_pricing_embed
-
         embeds = []
         parsed = self._make_parsed(input_tokens=1000, output_tokens=500)
         append_pricing_embed(embeds, parsed, request_cost=0.01, daily_cost=0.50)
@@ -235,32 +242,24 @@ class TestAppendPricingEmbed:
         assert "daily $0.50" in desc
 
     def test_pricing_embed_with_cache_hits(self):
-        from discord_claude.cogs.claude.embeds import append_pricing_embed
-
         embeds = []
         parsed = self._make_parsed(cache_read_tokens=5000)
         append_pricing_embed(embeds, parsed, request_cost=0.01, daily_cost=0.10)
         assert "5,000 cached" in embeds[0].description
 
     def test_pricing_embed_with_web_searches(self):
-        from discord_claude.cogs.claude.embeds import append_pricing_embed
-
         embeds = []
         parsed = self._make_parsed(web_search_requests=3)
         append_pricing_embed(embeds, parsed, request_cost=0.01, daily_cost=0.10)
         assert "3 searches" in embeds[0].description
 
     def test_pricing_embed_with_advisor_calls(self):
-        from discord_claude.cogs.claude.embeds import append_pricing_embed
-
         embeds = []
         parsed = self._make_parsed(advisor_calls=2)
         append_pricing_embed(embeds, parsed, request_cost=0.15, daily_cost=0.35)
         assert "advisor 2 calls" in embeds[0].description
 
     def test_pricing_embed_single_search_no_plural(self):
-        from discord_claude.cogs.claude.embeds import append_pricing_embed
-
         embeds = []
         parsed = self._make_parsed(web_search_requests=1)
         append_pricing_embed(embeds, parsed, request_cost=0.01, daily_cost=0.10)
@@ -268,16 +267,12 @@ class TestAppendPricingEmbed:
         assert "searches" not in embeds[0].description
 
     def test_pricing_embed_with_web_fetches(self):
-        from discord_claude.cogs.claude.embeds import append_pricing_embed
-
         embeds = []
         parsed = self._make_parsed(web_fetch_requests=2)
         append_pricing_embed(embeds, parsed, request_cost=0.01, daily_cost=0.10)
         assert "2 fetches" in embeds[0].description
 
     def test_pricing_embed_with_code_execution(self):
-        from discord_claude.cogs.claude.embeds import append_pricing_embed
-
         embeds = []
         parsed = self._make_parsed(code_execution_requests=1)
         append_pricing_embed(embeds, parsed, request_cost=0.01, daily_cost=0.10)
@@ -285,8 +280,6 @@ class TestAppendPricingEmbed:
         assert "execs" not in embeds[0].description
 
     def test_pricing_embed_no_server_tools_hidden(self):
-        from discord_claude.cogs.claude.embeds import append_pricing_embed
-
         embeds = []
         parsed = self._make_parsed()
         append_pricing_embed(embeds, parsed, request_cost=0.01, daily_cost=0.10)
@@ -300,8 +293,6 @@ class TestContextEmbeds:
     """Tests for context warning and compaction embed helpers."""
 
     def test_context_warning_embed(self):
-        from discord_claude.cogs.claude.embeds import append_context_warning_embed
-
         embeds = []
         append_context_warning_embed(embeds)
         assert len(embeds) == 1
@@ -309,8 +300,6 @@ class TestContextEmbeds:
         assert "85%" in embeds[0].description
 
     def test_compaction_embed(self):
-        from discord_claude.cogs.claude.embeds import append_compaction_embed
-
         embeds = []
         append_compaction_embed(embeds)
         assert len(embeds) == 1
@@ -322,22 +311,16 @@ class TestFallbackEmbed:
     """Tests for the append_fallback_embed helper."""
 
     def test_no_embed_when_no_fallback(self):
-        from discord_claude.cogs.claude.embeds import append_fallback_embed
-
         embeds = []
         append_fallback_embed(embeds, "claude-fable-5", None)
         assert embeds == []
 
     def test_no_embed_when_served_by_requested_model(self):
-        from discord_claude.cogs.claude.embeds import append_fallback_embed
-
         embeds = []
         append_fallback_embed(embeds, "claude-fable-5", "claude-fable-5")
         assert embeds == []
 
     def test_embed_when_fallback_served(self):
-        from discord_claude.cogs.claude.embeds import append_fallback_embed
-
         embeds = []
         append_fallback_embed(embeds, "claude-fable-5", "claude-opus-4-8")
         assert len(embeds) == 1
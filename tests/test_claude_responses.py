@@ -1,70 +1,51 @@
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
+import pytest
 
-class TestExtractResponseContent:
-    """Tests for the extract_response_content helper."""
+from discord_claude.cogs.claude.responses import extract_response_content
 
-    def test_text_only(self):
-        from discord_claude.cogs.claude.responses import extract_response_content
 
-        response = MagicMock()
-        text_block = MagicMock()
-        text_block.type = "text"
-        text_block.text = "Hello!"
-        text_block.citations = None
-        response.content = [text_block]
+class TestExtractResponseContent:
+    """Tests for the extract_response_content helper."""
 
-        parsed = extract_response_content(response)
-        assert parsed.text == "Hello!"
-        assert parsed.thinking == ""
+    @pytest.mark.parametrize(
+        ("blocks", "expected_text", "expected_thinking"),
+        [
+            pytest.param(
+                [SimpleNamespace(type="text", text="Hello!", citations=None)],
+                "Hello!",
+                "",
+                id="text_only",
+            ),
+            pytest.param(
+                [
+                    SimpleNamespace(type="thinking", thinking="Let me reason about this..."),
+                    SimpleNamespace(type="text", text="The answer is 42.", citations=None),
+                ],
+                "The answer is 42.",
+                "Let me reason about this...",
+                id="thinking_and_text",
+            ),
+            pytest.param(
+                [
+                    SimpleNamespace(type="redacted_thinking"),
+                    SimpleNamespace(type="text", text="Response.", citations=None),
+                ],
+                "Response.",
+                "",
+                id="redacted_thinking_ignored",
+            ),
+            pytest.param([], "No response.", "", id="empty_content"),
+        ],
+    )
+    def test_text_and_thinking(self, blocks, expected_text, expected_thinking):
+        parsed = extract_response_content(SimpleNamespace(content=blocks))
+        assert parsed.text == expected_text
+        assert parsed.thinking == expected_thinking
         assert parsed.citations == []
 
-    def test_thinking_and_text(self):
-        from discord_claude.cogs.claude.responses import extract_response_content
-
-        response = MagicMock()
-        thinking_block = MagicMock()
-        thinking_block.type = "thinking"
-        thinking_block.thinking = "Let me reason about this..."
-        text_block = MagicMock()
-        text_block.type = "text"
-        text_block.text = "The answer is 42."
-        text_block.citations = None
-        response.content = [thinking_block, text_block]
-
-        parsed = extract_response_content(response)
-        assert parsed.text == "The answer is 42."
-        assert parsed.thinking == "Let me reason about this..."
-
-    def test_redacted_thinking_ignored(self):
-        from discord_claude.cogs.claude.responses import extract_response_content
-
-        response = MagicMock()
-        redacted_block = MagicMock()
-        redacted_block.type = "redacted_thinking"
-        text_block = MagicMock()
-        text_block.type = "text"
-        text_block.text = "Response."
-        text_block.citations = None
-        response.content = [redacted_block, text_block]
-
-        parsed = extract_response_content(response)
-        assert parsed.text == "Response."
-        assert parsed.thinking == ""
-
-    def test_empty_content(self):
-        from discord_claude.cogs.claude.responses import extract_response_content
-
-        response = MagicMock()
-        response.content = []
-
-        parsed = extract_response_content(response)
-        assert parsed.text == "No response."
-        assert parsed.thinking == ""
-
     def test_with_web_citations(self):
-        from discord_claude.cogs.claude.responses import extract_response_content
-
         response = MagicMock()
         text_block = MagicMock()
         text_block.type = "text"
@@ -87,8 +68,6 @@ class TestExtractResponseContent:
         assert parsed.citations[1]["title"] == "Source 2"
 
     def test_with_document_citations(self):
-        from discord_claude.cogs.claude.responses import extract_response_content
-
         response = MagicMock()
         text_block = MagicMock()
         text_block.type = "text"
@@ -126,8 +105,6 @@ class TestExtractResponseContent:
         assert parsed.citations[1]["location"] == "p. 5"
 
     def test_document_citations_multi_page(self):
-        from discord_claude.cogs.claude.responses import extract_response_content
-
         response = MagicMock()
         text_block = MagicMock()
         text_block.type = "text"
@@ -146,8 +123,6 @@ class TestExtractResponseContent:
         assert parsed.citations[0]["location"] == "pp. 3–5"
 
     def test_document_citations_deduplicated(self):
-        from discord_claude.cogs.claude.responses import extract_response_content
-
         response = MagicMock()
         block1 = MagicMock()
         block1.type = "text"
@@ -174,8 +149,6 @@ class TestExtractResponseContent:
         assert len(parsed.citations) == 1
 
     def test_web_citations_deduplicated(self):
-        from discord_claude.cogs.claude.responses import extract_response_content
-
         response = MagicMock()
         text_block1 = MagicMock()
         text_block1.type = "text"
@@ -201,8 +174,6 @@ class TestExtractResponseContent:
         assert len(parsed.citations) == 1
 
     def test_tool_use_detected(self):
-        from discord_claude.cogs.claude.responses import extract_response_content
-
         response = MagicMock()
         text_block = MagicMock()
         text_block.type = "text"
@@ -220,8 +191,6 @@ class TestExtractResponseContent:
         assert parsed.tool_use_blocks[0].name == "memory"
 
     def test_server_tool_blocks_skipped(self):
-        from discord_claude.cogs.claude.responses import extract_response_content
-
         response = MagicMock()
         server_block = MagicMock()
         server_block.type = "server_tool_use"
@@ -238,8 +207,6 @@ class TestExtractResponseContent:
         assert len(parsed.tool_use_blocks) == 0
 
     def test_advisor_blocks_skipped(self):
-        from discord_claude.cogs.claude.responses import extract_response_content
-
         response = MagicMock()
         server_block = MagicMock()
         server_block.type = "server_tool_use"
@@ -258,8 +225,6 @@ class TestExtractResponseContent:
         assert parsed.tool_use_blocks == []
 
     def test_mcp_blocks_skipped(self):
-        from discord_claude.cogs.claude.responses import extract_response_content
-
         response = MagicMock()
         mcp_tool_use = MagicMock()
         mcp_tool_use.type = "mcp_tool_use"
@@ -280,8 +245,6 @@ class TestFallbackBlock:
     """The refusal-fallback switch marker block is skipped during extraction."""
 
     def test_fallback_block_skipped(self):
-        from discord_claude.cogs.claude.responses import extract_response_content
-
         response = MagicMock()
         fallback_block = MagicMock()
         fallback_block.type = "fallback"
@@ -1,8 +1,8 @@
 from types import SimpleNamespace
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from discord import Embed
+from discord import Embed, HTTPException
 
 from discord_claude.cogs.claude.embed_delivery import (
     DISCORD_EMBED_TOTAL_LIMIT,
@@ -102,3 +102,19 @@ async def test_send_embed_batches_preserves_single_file_kwarg_when_possible():
     assert result == "message"
     assert send.await_args.kwargs["file"] is file
     assert "files" not in send.await_args.kwargs
+
+
+@pytest.mark.asyncio
+async def test_send_embed_batches_falls_back_to_plain_text_and_logs_batch_sizes():
+    response = SimpleNamespace(status=400, reason="Bad Request")
+    send = AsyncMock(side_effect=[HTTPException(response, "invalid embed"), "fallback"])
+    logger = MagicMock()
+    embed = Embed(title="Response", description="hello")
+
+    result = await send_embed_batches(send, embeds=[embed], logger=logger)
+
+    assert result == "fallback"
+    assert send.await_args_list[1].kwargs["content"] == "**Response**\n\nhello"
+    logger.warning.assert_called_once()
+    log_args = logger.warning.call_args.args
+    assert log_args[2:] == (1, len("Responsehello"), [len("Responsehello")])
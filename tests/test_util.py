@@ -23,20 +23,20 @@ class TestChunkText:
     def test_short_text_single_chunk(self):
         """Short text should return a single chunk."""
         text = "Hello, world!"
-        result = chunk_text(text)
+        result = list(chunk_text(text))
         assert result == ["Hello, world!"]
 
     def test_exact_chunk_size(self):
         """Text exactly at chunk size should return one chunk."""
         text = "a" * CHUNK_TEXT_SIZE
-        result = chunk_text(text)
+        result = list(chunk_text(text))
         assert len(result) == 1
         assert result[0] == text
 
     def test_text_splits_into_multiple_chunks(self):
         """Text longer than chunk size should split into multiple chunks."""
         text = "a" * (CHUNK_TEXT_SIZE * 2 + 100)
-        result = chunk_text(text)
+        result = list(chunk_text(text))
         assert len(result) == 3
         assert len(result[0]) == CHUNK_TEXT_SIZE
         assert len(result[1]) == CHUNK_TEXT_SIZE
@@ -45,7 +45,7 @@ class TestChunkText:
     def test_custom_chunk_size(self):
         """Custom chunk size should be respected."""
         text = "Hello, world! This is a test."
-        result = chunk_text(text, chunk_size=10)
+        result = list(chunk_text(text, chunk_size=10))
         assert len(result) == 3
         assert result[0] == "Hello, wor"
         assert result[1] == "ld! This i"
@@ -53,9 +53,15 @@ class TestChunkText:
 
     def test_empty_string(self):
         """Empty string should return empty list."""
-        result = chunk_text("")
+        result = list(chunk_text(""))
         assert result == []
 
+    def test_chunks_are_produced_lazily(self):
+        """chunk_text yields chunks on demand instead of building a list."""
+        chunks = chunk_text("a" * (CHUNK_TEXT_SIZE * 3))
+        assert not isinstance(chunks, list)
+        assert next(chunks) == "a" * CHUNK_TEXT_SIZE
+
 
 class TestTruncateText:
     """Tests for the truncate_text function."""
@@ -132,18 +138,16 @@ class TestChatCompletionParameters:
         assert params.advisor_model is None
         assert params.tool_choice is None
 
-    def test_tools_isolation_between_instances(self):
-        """Tools list should not be shared between instances."""
-        params1 = ChatCompletionParameters(model="claude-sonnet-4")
-        params2 = ChatCompletionParameters(model="claude-sonnet-4")
-        params1.tools.append("web_search")
-        assert params2.tools == []
-
-    def test_mcp_preset_names_isolation_between_instances(self):
+    @pytest.mark.parametrize(
+        ("field", "value"),
+        [("tools", "web_search"), ("mcp_preset_names", "github")],
+    )
+    def test_list_fields_isolated_between_instances(self, field, value):
+        """List defaults should not be shared between instances."""
         params1 = ChatCompletionParameters(model="claude-sonnet-4")
         params2 = ChatCompletionParameters(model="claude-sonnet-4")
-        params1.mcp_preset_names.append("github")
-        assert params2.mcp_preset_names == []
+        getattr(params1, field).append(value)
+        assert getattr(params2, field) == []
 
 
 class TestConversation: